@@ -11,59 +11,25 @@ import soundfile as sf
 import whisper
 import time
 from kokoro import KPipeline
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
 
 from ollama import generate
+from jd_ingest import load_jd_profile
+from question_bank import QuestionBank
+from report_renderer import save_report_async
+
+question_bank = QuestionBank()
 
 # Mock functions for demonstration — replace with real logic
 def generate_job_questions(jd_file_path):
     """
-    jd_file: job description file path
+    jd_file: job description file path (.txt or .pdf)
     Returns: list of interview questions as strings
     """
-    # Read job description from file
-    with open(jd_file_path, "r") as file:
-        job_description = file.read()
-
-    # Build the prompt for generating interview questions
-    prompt = f"""
-    You are a helpful assistant trained to generate interview questions based on job descriptions.
-
-    Task: Read the job description provided and generate relevant interview questions that assess a candidate’s fit for the role.
-
-    Instructions:
-    - Focus on the required skills, responsibilities, and qualifications.
-    - Include a mix of technical, behavioral, and situational questions.
-    - Generate between 2 to 3 interview questions.
-    - Return ONLY the questions as a clean, numbered list (e.g., 1. ..., 2. ..., etc.).
-    - Do NOT include any introduction, explanation, or summary. Only output the questions.
-
-    JOB DESCRIPTION:
-    {job_description}
-    """
-
-    # Call Ollama using your custom or local LLaMA 3.2:1B model
-    response = generate(
-        model="llama3.2:1b",  # Replace with your actual model name
-        prompt=prompt
-    )
-
-    # Extract and split the response into a list of questions
-    raw_response = response['response']
-    
-    # Try splitting by numbered list
-    questions = [
-        q.strip().lstrip("0123456789. ").strip()
-        for q in raw_response.strip().split("\n")
-        if q.strip()
-    ]
+    # Condensed skill/requirement profile keeps the prompt bounded for long JDs
+    job_description = load_jd_profile(jd_file_path)
 
-    # Filter out any empty or non-question lines
-    questions = [q for q in questions if "?" in q]
-
-    return questions
+    # Reuse stored questions for covered skills; the LLM only fills the gaps
+    return question_bank.questions_for_profile(job_description)
 
 
 # Convert User Voice to Text
@@ -98,7 +64,7 @@ def evaluate_responses(jd_file_path, qa_dict):
     Evaluates a set of candidate answers to multiple interview questions using LLM scoring and feedback.
 
     Parameters:
-    - jd_file_path: Path to the job description file.
+    - jd_file_path: Path to the job description file (.txt or .pdf).
     - qa_dict: Dictionary with interview_question as key and (input_method, candidate_response) as value.
                input_method: 'v' for voice (uses voice_2_txt), 't' for text (uses provided response)
 
@@ -106,9 +72,8 @@ def evaluate_responses(jd_file_path, qa_dict):
     - A single comprehensive evaluation report covering all questions and answers.
     """
 
-    # Read job description from file
-    with open(jd_file_path, "r") as file:
-        job_description = file.read()
+    # Use the cached JD profile rather than the raw JD text
+    job_description = load_jd_profile(jd_file_path)
 
     # Gather all responses
     combined_qna = ""
@@ -121,7 +86,7 @@ def evaluate_responses(jd_file_path, qa_dict):
     prompt = f"""
     You are an experienced interview evaluator.
 
-    Task: Assess the candidate's responses to the following interview questions, considering the provided job description.
+    Task: Assess the candidate's responses to the following interview questions, considering the provided job profile.
 
     Instructions:
     1. For EACH question-response pair:
@@ -140,7 +105,7 @@ def evaluate_responses(jd_file_path, qa_dict):
        - A summary assessment of the candidate's suitability for the role based on all responses
        - Constructive feedback on how the candidate could improve for future interviews
 
-    JOB DESCRIPTION:
+    JOB PROFILE:
     {job_description}
 
     CANDIDATE RESPONSES:
@@ -172,93 +137,6 @@ TEXT_FILENAME = 'user_answer.txt'
 AUDIO_FILENAME = 'user_answer.wav'
 SAMPLE_RATE = 44100
 
-def save_report_to_pdf(qa_dict, evaluation_summary, filename="Interview_Evaluation_Report.pdf"):
-    from reportlab.platypus import (
-        SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, KeepTogether
-    )
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib import colors
-
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(name="QTitle", fontSize=12, leading=16, spaceAfter=4, fontName='Helvetica-Bold'))
-    styles.add(ParagraphStyle(name="Answer", fontSize=10.5, leading=14, spaceAfter=10))
-    styles.add(ParagraphStyle(name="Meta", fontSize=9.5, leading=12, textColor=colors.grey))
-    styles.add(ParagraphStyle(name="CustomBullet", parent=styles["Normal"], leftIndent=15, bulletIndent=0, spaceBefore=6))
-    styles.add(ParagraphStyle(name="SectionHeader", fontSize=14, leading=18, spaceAfter=12, alignment=1))  # centered
-
-    doc = SimpleDocTemplate(filename, pagesize=A4, rightMargin=36, leftMargin=36, topMargin=48, bottomMargin=36)
-    story = []
-
-    story.append(Paragraph("Interview Evaluation Report", styles["Title"]))
-    story.append(Spacer(1, 24))
-
-    for idx, (question, (method, answer)) in enumerate(qa_dict.items(), 1):
-        # Create a bordered table-style card for each question-answer pair
-        data = [
-            [Paragraph(f"Q{idx}: {question}", styles["QTitle"])],
-            [Paragraph(f"<b>Response Method:</b> {'Voice (Transcribed)' if method == 'v' else 'Text'}", styles["Meta"])],
-            [Paragraph(answer, styles["Answer"])]
-        ]
-
-        table = Table(data, colWidths=[doc.width], hAlign="LEFT", style=TableStyle([
-            ('BOX', (0,0), (-1,-1), 0.5, colors.black),
-            ('INNERGRID', (0,0), (-1,-1), 0.25, colors.grey),
-            ('BACKGROUND', (0,0), (0,0), colors.whitesmoke),
-            ('LEFTPADDING', (0,0), (-1,-1), 8),
-            ('RIGHTPADDING', (0,0), (-1,-1), 8),
-            ('TOPPADDING', (0,0), (-1,-1), 6),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 6),
-        ]))
-
-        story.append(KeepTogether(table))
-        story.append(Spacer(1, 12))
-
-        # Insert page break every 5 questions
-        if idx % 5 == 0 and idx != len(qa_dict):
-            story.append(PageBreak())
-
-    # Page Break before Evaluation
-    story.append(PageBreak())
-
-    story.append(Paragraph("Final Evaluation Summary", styles["SectionHeader"]))
-    story.append(Spacer(1, 16))
-
-    # ---- Format Evaluation Text ---- #
-    def parse_evaluation_text(text):
-        lines = text.splitlines()
-        blocks = []
-
-        for line in lines:
-            if line.startswith("### **Overall Score**"):
-                blocks.append(Paragraph("🏅 <b>Overall Score</b>", styles["Heading2"]))
-            elif line.startswith("### **Summary Assessment of Suitability**"):
-                blocks.append(Paragraph("🧠 <b>Suitability Summary</b>", styles["Heading2"]))
-            elif line.startswith("### **Criteria Evaluations**"):
-                blocks.append(Spacer(1, 10))
-                blocks.append(Paragraph("📊 <b>Criteria Evaluations</b>", styles["Heading2"]))
-            elif line.startswith("### **Feedback**"):
-                blocks.append(Spacer(1, 12))
-                blocks.append(Paragraph("📝 <b>Feedback</b>", styles["Heading2"]))
-            elif line.startswith("#### **"):
-                blocks.append(Spacer(1, 6))
-                blocks.append(Paragraph(line.replace("#### **", "<b>").replace("**", "</b>"), styles["Heading3"]))
-            elif line.strip().startswith(("1. ", "2. ", "3. ", "4. ")):
-                blocks.append(Paragraph(line.strip(), styles["CustomBullet"]))
-            elif line.strip():
-                blocks.append(Paragraph(line.strip(), styles["Normal"]))
-            else:
-                blocks.append(Spacer(1, 6))
-        return blocks
-
-    story.extend(parse_evaluation_text(evaluation_summary))
-
-    doc.build(story)
-    print(f"✅ PDF Report saved as: {filename}")
-    return filename
-
-
-
 # Main App
 class InterviewApp:
     def __init__(self, root):
@@ -312,9 +190,18 @@ class InterviewApp:
         threading.Thread(target=self.load_questions).start()
 
     def load_questions(self):
-        self.questions = generate_job_questions("jd.txt")
+        try:
+            self.questions = generate_job_questions("jd.txt")
+        except ValueError as e:
+            self.root.after(0, lambda: self.show_load_error(e))
+            return
         self.root.after(0, self.show_question)
 
+    def show_load_error(self, error):
+        messagebox.showerror("Job Description Error", f"Error: {str(error)}")
+        self.status_label.config(text="Click 'Start Interview' to begin.")
+        self.start_button.config(state="normal")
+
     def show_question(self):
         if self.current_index >= len(self.questions):
             self.finish_interview()
@@ -449,11 +336,25 @@ class InterviewApp:
         text_box.config(state="disabled")
         text_box.pack(expand=True, fill="both")
 
-        def save_pdf():
-            filename = save_report_to_pdf(self.qa_dict, report)
+        def on_pdf_saved(future):
+            # Called from the render worker; hand the result back to the Tk thread
+            self.root.after(0, lambda: show_pdf_result(future))
+
+        def show_pdf_result(future):
+            save_button.config(state="normal")
+            try:
+                filename = future.result()
+            except Exception as e:
+                messagebox.showerror("Save Failed", f"Error: {str(e)}")
+                return
             messagebox.showinfo("Saved", f"PDF saved as: {filename}")
 
-        tk.Button(self.frame, text="💾 Save as PDF", command=save_pdf).pack(pady=5)
+        def save_pdf():
+            save_button.config(state="disabled")
+            save_report_async(self.qa_dict, report, on_done=on_pdf_saved)
+
+        save_button = tk.Button(self.frame, text="💾 Save as PDF", command=save_pdf)
+        save_button.pack(pady=5)
         tk.Button(self.frame, text="Close", command=self.root.quit).pack(pady=5)
 
 
@@ -0,0 +1,67 @@
+"""
+Benchmark for PDF report rendering with 5, 50 and 500 Q&A entries.
+
+Usage: python bench_report.py
+"""
+import os
+import tempfile
+import time
+
+from report_renderer import export_reports, save_report_to_pdf
+
+SIZES = (5, 50, 500)
+BULK_SESSIONS = 20
+
+SAMPLE_SUMMARY = """### **Overall Score**
+72/100
+
+### **Summary Assessment of Suitability**
+The candidate shows solid technical grounding with room to improve on depth.
+
+### **Feedback**
+1. Give concrete examples from past projects.
+2. Quantify the impact of your work.
+"""
+
+
+def make_qa_dict(num_entries):
+    answer = "I would start by clarifying the requirements, then break the problem down. " * 6
+    return {
+        f"Question {i}: how would you approach scenario {i} in this role?": ("t" if i % 2 else "v", answer)
+        for i in range(1, num_entries + 1)
+    }
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        out = os.path.join(tmp_dir, "report.pdf")
+
+        # Warm up style cache and imports so the first row is not penalised
+        save_report_to_pdf(make_qa_dict(1), SAMPLE_SUMMARY, out)
+
+        print(f"{'entries':>8} {'single (s)':>12} {'segmented (s)':>14}")
+        for size in SIZES:
+            qa_dict = make_qa_dict(size)
+            single = timed(save_report_to_pdf, qa_dict, SAMPLE_SUMMARY, out, segment_size=None)
+            segmented = timed(save_report_to_pdf, qa_dict, SAMPLE_SUMMARY, out)
+            print(f"{size:>8} {single:>12.3f} {segmented:>14.3f}")
+
+        sessions = [
+            (make_qa_dict(SIZES[1]), SAMPLE_SUMMARY, os.path.join(tmp_dir, f"session_{i}.pdf"))
+            for i in range(BULK_SESSIONS)
+        ]
+        # Same single-pass render per report as export_reports, just one after another
+        sequential = sum(timed(save_report_to_pdf, *session, segment_size=None) for session in sessions)
+        bulk = timed(export_reports, sessions)
+        print(f"\nBulk export of {BULK_SESSIONS} x {SIZES[1]}-entry reports: "
+              f"sequential {sequential:.3f}s, export_reports {bulk:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from ollama import generate
+
+
+# Constants
+JD_MODEL = "llama3.2:1b"
+JD_CACHE_DIR = ".jd_cache"
+CHUNK_CHARS = 3000           # ~750 tokens per map call, well inside the 1B context
+MAX_PROFILE_CHARS = 1500     # hard cap on what is pasted into downstream prompts
+MAX_SUMMARY_CHARS = 800      # cap per map/reduce output, so every reduce round shrinks the input
+MAX_REDUCE_ROUNDS = 4
+MAX_WORKERS = 4
+PROFILE_VERSION = 1          # bump when the summarize/reduce prompts change to invalidate the cache
+
+
+def iter_jd_pages(jd_file_path):
+    """
+    Yields the job description one page at a time.
+
+    Parameters:
+    - jd_file_path: Path to a .txt or .pdf job description.
+
+    Returns:
+    - Generator of page text strings. Text files are yielded line by line.
+    """
+    if jd_file_path.lower().endswith(".pdf"):
+        from pypdf import PdfReader
+
+        reader = PdfReader(jd_file_path)
+        for page in reader.pages:
+            text = page.extract_text() or ""
+            if text.strip():
+                yield text
+    else:
+        with open(jd_file_path, "r") as file:
+            for line in file:
+                yield line
+
+
+def iter_jd_chunks(jd_file_path, chunk_chars=CHUNK_CHARS):
+    """
+    Streams pages into chunks of roughly `chunk_chars` characters, split on line boundaries.
+    Only the current chunk is buffered here; see bounded_map for how many are in flight.
+    """
+    buffer = []
+    size = 0
+    for page in iter_jd_pages(jd_file_path):
+        for line in page.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if size + len(line) > chunk_chars and buffer:
+                yield "\n".join(buffer)
+                buffer, size = [], 0
+            # Hard-wrap a single oversized line so no chunk exceeds the budget
+            while len(line) > chunk_chars:
+                yield line[:chunk_chars]
+                line = line[chunk_chars:]
+            buffer.append(line)
+            size += len(line) + 1
+    if buffer:
+        yield "\n".join(buffer)
+
+
+def summarize_chunk(chunk):
+    """
+    Map step: condenses one JD chunk into short bullet points of skills and requirements.
+    """
+    prompt = f"""
+    You are a helpful assistant that extracts hiring requirements from job descriptions.
+
+    Task: Read the job description excerpt below and list the key skills, responsibilities and qualifications it asks for.
+
+    Instructions:
+    - Return ONLY a bulleted list (e.g., - ..., - ...), one short item per line.
+    - Keep each item under 12 words.
+    - Do NOT include company boilerplate, benefits or any explanation.
+
+    JOB DESCRIPTION EXCERPT:
+    {chunk}
+    """
+
+    response = generate(model=JD_MODEL, prompt=prompt)
+    return response['response'].strip()[:MAX_SUMMARY_CHARS]
+
+
+def reduce_summaries(summaries):
+    """
+    Reduce step: merges chunk summaries into one compact, de-duplicated profile.
+    """
+    prompt = f"""
+    You are a helpful assistant that writes compact candidate requirement profiles.
+
+    Task: Merge the requirement lists below into a single profile for the role.
+
+    Instructions:
+    - Start with a line "Role: <job title>".
+    - Then a "Skills:" line with a comma-separated list of the most important skills.
+    - Then a "Requirements:" bulleted list of at most 8 short items.
+    - Remove duplicates. Do NOT include any introduction or explanation.
+
+    REQUIREMENT LISTS:
+    {summaries}
+    """
+
+    response = generate(model=JD_MODEL, prompt=prompt)
+    return response['response'].strip()[:MAX_SUMMARY_CHARS]
+
+
+def bounded_map(pool, fn, iterable, window):
+    """
+    Like pool.map, but keeps at most `window` items submitted at once, so a long
+    generator is consumed only as fast as results come back. Results keep input order.
+    """
+    pending = deque()
+    for item in iterable:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _cache_key(jd_file_path):
+    """
+    Hashes the file contents together with the model and prompt version, so changing
+    either one rebuilds cached profiles.
+    """
+    sha = hashlib.sha256(f"{JD_MODEL}:v{PROFILE_VERSION}:".encode())
+    with open(jd_file_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 16), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def load_jd_profile(jd_file_path, cache_dir=JD_CACHE_DIR, max_workers=MAX_WORKERS):
+    """
+    Builds (or loads from cache) a compact skill and requirement profile for a job description.
+
+    Parameters:
+    - jd_file_path: Path to a .txt or .pdf job description.
+    - cache_dir: Directory where profiles are cached, keyed by content hash, model and prompt version.
+    - max_workers: Number of chunk summaries run in parallel.
+
+    Returns:
+    - Profile text, never longer than MAX_PROFILE_CHARS.
+
+    Raises:
+    - ValueError: if no text can be extracted from the file (e.g. empty or scanned PDF).
+    """
+    digest = _cache_key(jd_file_path)
+    cache_path = os.path.join(cache_dir, f"{digest}.json")
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r") as file:
+                return json.load(file)["profile"]
+        except (OSError, ValueError, KeyError):
+            pass  # unreadable entry, e.g. from an interrupted write; rebuild it
+
+    # Map: summarize chunks in parallel as they are streamed off disk
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        summaries = list(bounded_map(pool, summarize_chunk, iter_jd_chunks(jd_file_path), max_workers))
+    if not summaries:
+        raise ValueError(f"No text could be extracted from job description '{jd_file_path}'")
+
+    # Reduce: fold summaries in batches until they fit in a single call
+    for _ in range(MAX_REDUCE_ROUNDS):
+        if len(summaries) <= 1:
+            break
+        batches, batch, size = [], [], 0
+        for summary in summaries:
+            if size + len(summary) > CHUNK_CHARS and batch:
+                batches.append("\n".join(batch))
+                batch, size = [], 0
+            batch.append(summary)
+            size += len(summary) + 1
+        batches.append("\n".join(batch))
+        if len(batches) == 1 or len(batches) >= len(summaries):
+            break
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            summaries = list(pool.map(reduce_summaries, batches))
+
+    # Final call never sees more than one chunk's worth of input
+    profile = reduce_summaries("\n".join(summaries)[:CHUNK_CHARS])
+    profile = profile[:MAX_PROFILE_CHARS]
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w") as file:
+        json.dump({"source": os.path.basename(jd_file_path), "profile": profile}, file)
+    os.replace(tmp_path, cache_path)
+
+    return profile
@@ -1,52 +1,20 @@
 from ollama import generate
+from jd_ingest import load_jd_profile
+from question_bank import QuestionBank
+
+question_bank = QuestionBank()
 
 
 def generate_job_questions(jd_file_path):
     """
-    jd_file: job description file path
+    jd_file: job description file path (.txt or .pdf)
     Returns: list of interview questions as strings
     """
-    # Read job description from file
-    with open(jd_file_path, "r") as file:
-        job_description = file.read()
-
-    # Build the prompt for generating interview questions
-    prompt = f"""
-    You are a helpful assistant trained to generate interview questions based on job descriptions.
-
-    Task: Read the job description provided and generate relevant interview questions that assess a candidate’s fit for the role.
-
-    Instructions:
-    - Focus on the required skills, responsibilities, and qualifications.
-    - Include a mix of technical, behavioral, and situational questions.
-    - Generate between 2 to 3 interview questions.
-    - Return ONLY the questions as a clean, numbered list (e.g., 1. ..., 2. ..., etc.).
-    - Do NOT include any introduction, explanation, or summary. Only output the questions.
-
-    JOB DESCRIPTION:
-    {job_description}
-    """
-
-    # Call Ollama using your custom or local LLaMA 3.2:1B model
-    response = generate(
-        model="llama3.2:1b",  # Replace with your actual model name
-        prompt=prompt
-    )
-
-    # Extract and split the response into a list of questions
-    raw_response = response['response']
-    
-    # Try splitting by numbered list
-    questions = [
-        q.strip().lstrip("0123456789. ").strip()
-        for q in raw_response.strip().split("\n")
-        if q.strip()
-    ]
-
-    # Filter out any empty or non-question lines
-    questions = [q for q in questions if "?" in q]
+    # Condensed skill/requirement profile keeps the prompt bounded for long JDs
+    job_description = load_jd_profile(jd_file_path)
 
-    return questions
+    # Reuse stored questions for covered skills; the LLM only fills the gaps
+    return question_bank.questions_for_profile(job_description)
 
 
 # Play question
@@ -171,7 +139,7 @@ def evaluate_responses(jd_file_path, qa_dict):
     Evaluates a set of candidate answers to multiple interview questions using LLM scoring and feedback.
 
     Parameters:
-    - jd_file_path: Path to the job description file.
+    - jd_file_path: Path to the job description file (.txt or .pdf).
     - qa_dict: Dictionary with interview_question as key and (input_method, candidate_response) as value.
                input_method: 'v' for voice (uses voice_2_txt), 't' for text (uses provided response)
 
@@ -179,9 +147,8 @@ def evaluate_responses(jd_file_path, qa_dict):
     - A single comprehensive evaluation report covering all questions and answers.
     """
 
-    # Read job description from file
-    with open(jd_file_path, "r") as file:
-        job_description = file.read()
+    # Use the cached JD profile rather than the raw JD text
+    job_description = load_jd_profile(jd_file_path)
 
     # Gather all responses
     combined_qna = ""
@@ -194,7 +161,7 @@ def evaluate_responses(jd_file_path, qa_dict):
     prompt = f"""
     You are an experienced interview evaluator.
 
-    Task: Assess the candidate's responses to the following interview questions, considering the provided job description.
+    Task: Assess the candidate's responses to the following interview questions, considering the provided job profile.
 
     Instructions:
     1. For EACH question-response pair:
@@ -213,7 +180,7 @@ def evaluate_responses(jd_file_path, qa_dict):
        - A summary assessment of the candidate's suitability for the role based on all responses
        - Constructive feedback on how the candidate could improve for future interviews
 
-    JOB DESCRIPTION:
+    JOB PROFILE:
     {job_description}
 
     CANDIDATE RESPONSES:
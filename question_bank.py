@@ -0,0 +1,260 @@
+import json
+import os
+import threading
+
+import numpy as np
+from ollama import embed, generate
+
+
+# Constants
+QUESTION_MODEL = "llama3.2:1b"
+EMBED_MODEL = "nomic-embed-text"
+BANK_DIR = "question_bank"
+NUM_QUESTIONS = 3
+MATCH_THRESHOLD = 0.60   # min cosine similarity for a stored question to cover a skill
+DEDUP_THRESHOLD = 0.92   # cosine similarity above which two questions are near-duplicates
+DEFAULT_TAG = "general"
+
+
+def _profile_field(profile, name):
+    """
+    Returns the text after "<name>:" in a profile, ignoring list and markdown bold markers.
+    """
+    for line in profile.splitlines():
+        line = line.strip().lstrip("-* ").strip()
+        if line.lower().startswith(name + ":"):
+            return line.split(":", 1)[1].strip(" *")
+    return ""
+
+
+def parse_profile_skills(profile):
+    """
+    Pulls the comma-separated skill names out of the "Skills:" line of a profile.
+    Falls back to the "Role:" line, then to DEFAULT_TAG, so tags stay short.
+    """
+    skills = [s.strip(" *.") for s in _profile_field(profile, "skills").split(",")]
+    skills = [s for s in skills if s]
+    if skills:
+        return skills
+    role = _profile_field(profile, "role").strip(" .")
+    return [role or DEFAULT_TAG]
+
+
+def embed_texts(texts):
+    """
+    Embeds a list of strings with the local Ollama embedding model.
+
+    Returns:
+    - float32 array of shape (len(texts), dim), rows L2-normalised so dot product == cosine.
+    """
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+    vectors = np.asarray(embed(model=EMBED_MODEL, input=texts)['embeddings'], dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def generate_questions_for_skills(job_profile, skills, num_questions):
+    """
+    Asks the LLM for new interview questions targeting only the uncovered skills.
+
+    Returns: list of interview questions as strings
+    """
+    focus = ", ".join(skills) if skills else "the overall role"
+    prompt = f"""
+    You are a helpful assistant trained to generate interview questions based on job descriptions.
+
+    Task: Read the job profile provided and generate relevant interview questions that assess a candidate’s fit for the role.
+
+    Instructions:
+    - Focus on these skills: {focus}.
+    - Include a mix of technical, behavioral, and situational questions.
+    - Generate exactly {num_questions} interview questions.
+    - Return ONLY the questions as a clean, numbered list (e.g., 1. ..., 2. ..., etc.).
+    - Do NOT include any introduction, explanation, or summary. Only output the questions.
+
+    JOB PROFILE:
+    {job_profile}
+    """
+
+    response = generate(model=QUESTION_MODEL, prompt=prompt)
+
+    # Extract and split the response into a list of questions
+    raw_response = response['response']
+    questions = [
+        q.strip().lstrip("0123456789. ").strip()
+        for q in raw_response.strip().split("\n")
+        if q.strip()
+    ]
+
+    # Filter out any empty or non-question lines
+    return [q for q in questions if "?" in q]
+
+
+class QuestionBank:
+    """
+    Persistent store of generated interview questions with skill tags and embeddings.
+
+    Questions and tags live in `questions.json`; their normalised embeddings are kept as a
+    single NumPy matrix in `embeddings.npy`, so retrieval is one matrix product.
+    """
+
+    def __init__(self, bank_dir=BANK_DIR):
+        self.bank_dir = bank_dir
+        self.meta_path = os.path.join(bank_dir, "questions.json")
+        self.emb_path = os.path.join(bank_dir, "embeddings.npy")
+        self.lock = threading.Lock()
+        self.entries = []        # [{"question": str, "tags": [str, ...]}]
+        self.embeddings = None   # (n, dim) float32, row i belongs to entries[i]
+        self.load()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def load(self):
+        if os.path.exists(self.meta_path) and os.path.exists(self.emb_path):
+            with open(self.meta_path, "r") as file:
+                self.entries = json.load(file)
+            self.embeddings = np.load(self.emb_path)
+            # An interrupted save can leave one file a batch ahead; keep the common prefix
+            count = min(len(self.entries), len(self.embeddings))
+            self.entries = self.entries[:count]
+            self.embeddings = self.embeddings[:count] if count else None
+
+    def save(self):
+        os.makedirs(self.bank_dir, exist_ok=True)
+        emb_tmp = self.emb_path + ".tmp"
+        meta_tmp = self.meta_path + ".tmp"
+        with open(emb_tmp, "wb") as file:
+            np.save(file, self.embeddings)
+        with open(meta_tmp, "w") as file:
+            json.dump(self.entries, file, indent=2)
+        # Swap both files in only once both are fully written
+        os.replace(emb_tmp, self.emb_path)
+        os.replace(meta_tmp, self.meta_path)
+
+    def add(self, questions, tags, vectors=None):
+        """
+        Adds questions to the bank, skipping near-duplicates of stored or same-batch questions.
+
+        Parameters:
+        - questions: list of question strings
+        - tags: list of skill-tag lists, one per question
+        - vectors: optional precomputed normalised embeddings for `questions`
+
+        Returns:
+        - list of the questions that were actually stored
+        """
+        if not questions:
+            return []
+        if vectors is None:
+            vectors = embed_texts(questions)
+
+        with self.lock:
+            kept, kept_tags, kept_vectors = [], [], []
+            for question, question_tags, vector in zip(questions, tags, vectors):
+                if self.embeddings is not None and len(self.embeddings):
+                    if float(np.max(self.embeddings @ vector)) >= DEDUP_THRESHOLD:
+                        continue
+                if kept_vectors and float(np.max(np.stack(kept_vectors) @ vector)) >= DEDUP_THRESHOLD:
+                    continue
+                kept.append(question)
+                kept_tags.append(list(question_tags))
+                kept_vectors.append(vector)
+
+            if not kept:
+                return []
+            new_rows = np.stack(kept_vectors).astype(np.float32)
+            self.embeddings = new_rows if self.embeddings is None else np.vstack([self.embeddings, new_rows])
+            self.entries.extend({"question": q, "tags": t} for q, t in zip(kept, kept_tags))
+            self.save()
+        return kept
+
+    def retrieve(self, skill_vectors, num_questions, threshold=MATCH_THRESHOLD):
+        """
+        Picks up to `num_questions` stored questions in rounds across skills, so a profile
+        with few skills can still be served entirely from the bank.
+
+        Returns:
+        - (questions, vectors, covered): the picked questions, their embedding rows, and
+          covered[i] telling whether skill i found a match.
+        """
+        covered = np.zeros(len(skill_vectors), dtype=bool)
+        # add() updates embeddings and entries under the lock; read them the same way
+        with self.lock:
+            if self.embeddings is None or not len(self.embeddings) or not len(skill_vectors):
+                return [], np.zeros((0, skill_vectors.shape[-1]), dtype=np.float32), covered
+
+            sims = skill_vectors @ self.embeddings.T        # (skills, questions)
+            # Per skill, stored questions above the threshold from best to worst match
+            ranked = {
+                skill_idx: [q for q in np.argsort(-sims[skill_idx]) if sims[skill_idx, q] >= threshold]
+                for skill_idx in np.argsort(-sims.max(axis=1))
+            }
+            picked = []
+            # Round-robin: each skill takes its best unpicked match, then its next best, ...
+            while len(picked) < num_questions and any(ranked.values()):
+                for skill_idx, candidates in ranked.items():
+                    if len(picked) >= num_questions:
+                        break
+                    while candidates:
+                        q_idx = candidates.pop(0)
+                        if q_idx not in picked:
+                            picked.append(q_idx)
+                            covered[skill_idx] = True
+                            break
+            return [self.entries[i]["question"] for i in picked], self.embeddings[picked], covered
+
+    def questions_for_profile(self, job_profile, num_questions=NUM_QUESTIONS):
+        """
+        Returns interview questions for a JD profile, reusing the bank where possible.
+        The LLM is only called for skills that no stored question covers. If the embedding
+        model is unavailable, questions are generated directly without using the bank.
+
+        Parameters:
+        - job_profile: profile text from jd_ingest.load_jd_profile
+        - num_questions: how many questions the session needs
+
+        Returns: list of interview questions as strings
+        """
+        skills = parse_profile_skills(job_profile)
+        try:
+            skill_vectors = embed_texts(skills)
+        except Exception as e:
+            print(f"Question bank unavailable ({EMBED_MODEL}): {e}")
+            return generate_questions_for_skills(job_profile, [], num_questions)
+        questions, picked_vectors, covered = self.retrieve(skill_vectors, num_questions)
+        if len(questions) >= num_questions:
+            return questions
+
+        # Fill coverage gaps with freshly generated questions
+        gaps = [skill for skill, ok in zip(skills, covered) if not ok]
+        missing = num_questions - len(questions)
+        generated = generate_questions_for_skills(job_profile, gaps, missing)
+        if not generated:
+            return questions
+        try:
+            vectors = embed_texts(generated)
+        except Exception as e:
+            print(f"Could not store generated questions ({EMBED_MODEL}): {e}")
+            return (questions + generated)[:num_questions]
+
+        # Tag each question with the skills it matches, falling back to its nearest skill
+        skill_sims = vectors @ skill_vectors.T
+        tags = [
+            [skills[i] for i in np.flatnonzero(row >= MATCH_THRESHOLD)] or [skills[int(np.argmax(row))]]
+            for row in skill_sims
+        ]
+        self.add(generated, tags, vectors)
+
+        # add() may have dropped a generated question as a near-duplicate of an older entry;
+        # it is still usable here unless it repeats a question already in this session
+        session_vectors = list(picked_vectors)
+        for question, vector in zip(generated, vectors):
+            if len(questions) >= num_questions:
+                break
+            if session_vectors and float(np.max(np.stack(session_vectors) @ vector)) >= DEDUP_THRESHOLD:
+                continue
+            questions.append(question)
+            session_vectors.append(vector)
+        return questions
@@ -0,0 +1,233 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.platypus import (
+    KeepTogether, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+)
+
+
+# Constants
+REPORT_FILENAME = "Interview_Evaluation_Report.pdf"
+QUESTIONS_PER_PAGE = 5
+SEGMENT_SIZE = 50   # Q&A entries per independently rendered segment; multiple of QUESTIONS_PER_PAGE
+
+CARD_STYLE = TableStyle([
+    ('BOX', (0,0), (-1,-1), 0.5, colors.black),
+    ('INNERGRID', (0,0), (-1,-1), 0.25, colors.grey),
+    ('BACKGROUND', (0,0), (0,0), colors.whitesmoke),
+    ('LEFTPADDING', (0,0), (-1,-1), 8),
+    ('RIGHTPADDING', (0,0), (-1,-1), 8),
+    ('TOPPADDING', (0,0), (-1,-1), 6),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 6),
+])
+
+# Evaluation headings emitted by the model, mapped to their report titles
+SECTION_HEADINGS = {
+    "### **Overall Score**": ("🏅 <b>Overall Score</b>", 0),
+    "### **Summary Assessment of Suitability**": ("🧠 <b>Suitability Summary</b>", 0),
+    "### **Criteria Evaluations**": ("📊 <b>Criteria Evaluations</b>", 10),
+    "### **Feedback**": ("📝 <b>Feedback</b>", 12),
+}
+
+
+@lru_cache(maxsize=1)
+def get_report_styles():
+    """
+    Builds the report stylesheet once per process; every later report reuses it.
+    """
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name="QTitle", fontSize=12, leading=16, spaceAfter=4, fontName='Helvetica-Bold'))
+    styles.add(ParagraphStyle(name="Answer", fontSize=10.5, leading=14, spaceAfter=10))
+    styles.add(ParagraphStyle(name="Meta", fontSize=9.5, leading=12, textColor=colors.grey))
+    styles.add(ParagraphStyle(name="CustomBullet", parent=styles["Normal"], leftIndent=15, bulletIndent=0, spaceBefore=6))
+    styles.add(ParagraphStyle(name="SectionHeader", fontSize=14, leading=18, spaceAfter=12, alignment=1))  # centered
+    return styles
+
+
+def make_doc_template(filename):
+    return SimpleDocTemplate(filename, pagesize=A4, rightMargin=36, leftMargin=36, topMargin=48, bottomMargin=36)
+
+
+def parse_evaluation_text(text, styles):
+    """
+    Converts the LLM evaluation text into report flowables.
+    """
+    blocks = []
+    for line in text.splitlines():
+        heading = next((h for h in SECTION_HEADINGS if line.startswith(h)), None)
+        if heading:
+            title, space = SECTION_HEADINGS[heading]
+            if space:
+                blocks.append(Spacer(1, space))
+            blocks.append(Paragraph(title, styles["Heading2"]))
+        elif line.startswith("#### **"):
+            blocks.append(Spacer(1, 6))
+            blocks.append(Paragraph(line.replace("#### **", "<b>").replace("**", "</b>"), styles["Heading3"]))
+        elif line.strip().startswith(("1. ", "2. ", "3. ", "4. ")):
+            blocks.append(Paragraph(line.strip(), styles["CustomBullet"]))
+        elif line.strip():
+            blocks.append(Paragraph(line.strip(), styles["Normal"]))
+        else:
+            blocks.append(Spacer(1, 6))
+    return blocks
+
+
+def build_qa_story(entries, start_idx, total, width, styles):
+    """
+    Lays out bordered question/answer cards for `entries`, numbering from `start_idx`.
+    """
+    story = []
+    for idx, (question, (method, answer)) in enumerate(entries, start_idx):
+        data = [
+            [Paragraph(f"Q{idx}: {question}", styles["QTitle"])],
+            [Paragraph(f"<b>Response Method:</b> {'Voice (Transcribed)' if method == 'v' else 'Text'}", styles["Meta"])],
+            [Paragraph(answer, styles["Answer"])]
+        ]
+        story.append(KeepTogether(Table(data, colWidths=[width], hAlign="LEFT", style=CARD_STYLE)))
+        story.append(Spacer(1, 12))
+
+        # Insert page break every 5 questions
+        if idx % QUESTIONS_PER_PAGE == 0 and idx != total:
+            story.append(PageBreak())
+    return story
+
+
+def render_segment(filename, entries, start_idx, total, evaluation_summary=None, with_title=False):
+    """
+    Renders one slice of the report to `filename`. The first segment carries the title,
+    the last one the evaluation summary, so segments concatenate into the full report.
+    """
+    styles = get_report_styles()
+    doc = make_doc_template(filename)
+    story = []
+
+    if with_title:
+        story.append(Paragraph("Interview Evaluation Report", styles["Title"]))
+        story.append(Spacer(1, 24))
+
+    story.extend(build_qa_story(entries, start_idx, total, doc.width, styles))
+
+    if evaluation_summary is not None:
+        # Page Break before Evaluation
+        story.append(PageBreak())
+        story.append(Paragraph("Final Evaluation Summary", styles["SectionHeader"]))
+        story.append(Spacer(1, 16))
+        story.extend(parse_evaluation_text(evaluation_summary, styles))
+
+    doc.build(story)
+    return filename
+
+
+def _render_segment_args(args):
+    return render_segment(*args)
+
+
+def save_report_to_pdf(qa_dict, evaluation_summary, filename=REPORT_FILENAME,
+                       segment_size=SEGMENT_SIZE, max_workers=None):
+    """
+    Saves the Q&A transcript and evaluation summary as a PDF report.
+
+    Parameters:
+    - qa_dict: Dictionary with interview_question as key and (input_method, answer) as value.
+    - evaluation_summary: Evaluation text returned by evaluate_responses.
+    - filename: Output PDF path.
+    - segment_size: Reports longer than this are laid out in segments on a process pool
+                    and merged into the output file. None renders in a single pass.
+    - max_workers: Process pool size for segmented rendering (defaults to CPU count).
+
+    Note: segmented output is not streamed page by page. pypdf's PdfWriter only writes a
+    whole document (the page tree and xref table come last), so every merged page stays in
+    memory until the single final write. Segmenting bounds layout work per process, not
+    the memory used by the merge.
+
+    Returns:
+    - The output filename.
+    """
+    entries = list(qa_dict.items())
+    total = len(entries)
+
+    if segment_size is None or total <= segment_size:
+        render_segment(filename, entries, 1, total, evaluation_summary, with_title=True)
+        print(f"✅ PDF Report saved as: {filename}")
+        return filename
+
+    # Segments start on a page boundary, so they must hold whole pages of questions
+    segment_size -= segment_size % QUESTIONS_PER_PAGE
+    segment_size = max(segment_size, QUESTIONS_PER_PAGE)
+
+    from pypdf import PdfReader, PdfWriter
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jobs = []
+        for start in range(0, total, segment_size):
+            last = start + segment_size >= total
+            jobs.append((
+                os.path.join(tmp_dir, f"segment_{start:06d}.pdf"),
+                entries[start:start + segment_size],
+                start + 1,
+                total,
+                evaluation_summary if last else None,
+                start == 0,
+            ))
+
+        writer = PdfWriter()
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            # map yields in order; pages are collected in the writer and written once at the end,
+            # so large reports are merged, not streamed
+            for segment_path in pool.map(_render_segment_args, jobs):
+                for page in PdfReader(segment_path).pages:
+                    writer.add_page(page)
+
+        with open(filename, "wb") as file:
+            writer.write(file)
+
+    print(f"✅ PDF Report saved as: {filename}")
+    return filename
+
+
+def _save_report_args(args):
+    return save_report_to_pdf(*args, segment_size=None)
+
+
+def export_reports(sessions, max_workers=None):
+    """
+    Renders many reports in one call on a process pool.
+
+    Parameters:
+    - sessions: iterable of (qa_dict, evaluation_summary, filename) tuples.
+    - max_workers: Process pool size (defaults to CPU count).
+
+    Returns:
+    - List of output filenames, in input order.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        # Each worker renders whole reports; nesting a second pool per report would oversubscribe
+        return list(pool.map(_save_report_args, sessions))
+
+
+# Single background worker so PDF layout never runs on the Tk thread
+_report_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def save_report_async(qa_dict, evaluation_summary, filename=REPORT_FILENAME, on_done=None):
+    """
+    Queues save_report_to_pdf on a background thread, rendering in a single pass.
+    The thread already keeps the UI responsive, and starting a process pool from a
+    thread of the multithreaded Tk app risks fork deadlocks.
+
+    Parameters:
+    - on_done: optional callback receiving the finished Future (called from the worker thread).
+
+    Returns:
+    - concurrent.futures.Future resolving to the output filename.
+    """
+    future = _report_executor.submit(save_report_to_pdf, dict(qa_dict), evaluation_summary, filename,
+                                     segment_size=None)
+    if on_done is not None:
+        future.add_done_callback(on_done)
+    return future